@@ -14,13 +14,35 @@ v4 변경사항:
 스크래핑 범위: 전월 1일 ~ 실행일로부터 1년 후까지
 """
 
+import calendar
+import gzip
+import hashlib
+import http.client
 import json
+import logging
 import re
+import sys
+import threading
 import time
-import random
-from datetime import datetime, timedelta
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
+import zlib
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import chain
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Final
+from urllib.error import HTTPError
+from urllib.parse import urljoin, urlsplit
+
+orjson: ModuleType | None
+try:
+    import orjson  # 선택 의존성: 설치되어 있으면 JSON 인코딩/디코딩에 사용
+except ImportError:
+    orjson = None
+
+log = logging.getLogger("scraper")
 
 
 # ─── 카테고리 정의 ───
@@ -143,6 +165,9 @@ PAYSABLE_KEYWORDS = {
     ],
 }
 
+# 월별 페이지 동시 요청 수 (blip.kr 부하 고려)
+MAX_WORKERS = 4
+
 DEFAULT_HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -151,19 +176,74 @@ DEFAULT_HEADERS = {
     ),
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+    # br은 표준 라이브러리로 해제할 수 없으므로 gzip만 요청
+    "Accept-Encoding": "gzip",
 }
 
+# ─── 정규식 (모듈 로드 시 1회 컴파일) ───
+
+# 페이지 전체를 str로 디코딩하지 않도록 bytes 패턴으로 청크 위치를 찾음
+_RSC_PUSH_RE: Final = re.compile(rb'self\.__next_f\.push\(\[1,"(.*?)"\]\)', re.DOTALL)
+# 한글명(blipName) 객체와 영문명(names) 객체를 한 번의 순회로 찾음
+_UNIT_RE: Final = re.compile(
+    r'\{"unitId":(?P<ko_uid>\d+),"artistId":\d+,"isFilter":\d+,"blipName":"(?P<ko>[^"]*)"'
+    r'|\{"code":"en","name":"(?P<en>[^"]*)","unitId":(?P<en_uid>\d+)\}'
+)
+_ANNIVERSARY_RE: Final = re.compile(r'\d+주년')
+# UTF-8로 쓸 수 없는 짝 없는 서로게이트 (이모지 중간에서 잘린 제목 등)
+_LONE_SURROGATE_RE: Final = re.compile('[\ud800-\udfff]')
+
+# message 필드 등 문자열 값 안의 실제 줄바꿈(decode_rsc_chunk 결과)을 허용
+_JSON_DECODER: Final = json.JSONDecoder(strict=False)
+
 
 # ─── RSC Payload 공통 디코딩 ───
 
+# 최후 수단용: \\, \", \n 을 왼쪽부터 한 번에 치환 (센티널 문자열 불필요)
+_JS_ESCAPE_RE: Final = re.compile(r'\\\\|\\"|\\n')
+_JS_ESCAPE_MAP: Final = {"\\\\": "\\", '\\"': '"', "\\n": "\n"}
+
+
 def decode_rsc_chunk(chunk: str) -> str:
     """JavaScript 이중 이스케이프를 해제하여 파싱 가능한 문자열로 변환"""
-    raw = chunk
-    raw = raw.replace("\\\\", "\x00BS\x00")
-    raw = raw.replace('\\"', '"')
-    raw = raw.replace("\\n", "\n")
-    raw = raw.replace("\x00BS\x00", "\\")
-    return raw
+    # 청크는 JSON.stringify로 만들어진 문자열 리터럴이므로 따옴표로 감싸면
+    # 그대로 JSON 문자열 → C 디코더 한 번으로 모든 이스케이프 해제
+    quoted = '"' + chunk + '"'
+    if orjson is not None:
+        try:
+            return orjson.loads(quoted)
+        except orjson.JSONDecodeError:
+            # orjson은 짝 없는 서로게이트(\ud83d, 이모지 중간에서 잘린 제목 등)나
+            # 제어 문자를 거부하지만 표준 디코더(strict=False)는 허용 → 아래에서 재시도
+            pass
+    try:
+        return _JSON_DECODER.decode(quoted)
+    except json.JSONDecodeError:
+        # JSON에 없는 JS 이스케이프(\x41, \' 등)가 섞인 경우 → 아래 방식
+        pass
+
+    # unicode_escape가 \\, \", \n, \xHH, \uXXXX 등을 C 레벨에서 한 번에 해제.
+    # 한글 등 비ASCII 문자는 먼저 \uXXXX로 바꿔 두므로 그대로 복원됨
+    # (UTF-8 바이트를 latin-1로 왕복하면 \u0080~\u00ff 이스케이프와 섞일 때 글자가 깨짐)
+    try:
+        return chunk.encode("ascii", "backslashreplace").decode("unicode_escape")
+    except UnicodeError:
+        # 잘린 \x, \u 등 해석할 수 없는 이스케이프 → 정규식 치환
+        pass
+
+    return _JS_ESCAPE_RE.sub(lambda m: _JS_ESCAPE_MAP[m.group(0)], chunk)
+
+
+def _rsc_chunks(html: bytes, marker: bytes) -> Iterator[str]:
+    """marker가 들어 있는 RSC 청크만 골라 디코딩된 문자열로 하나씩 반환"""
+    # 청크를 복사·디코딩하기 전에 원본 HTML 위에서 먼저 걸러냄
+    # (레이아웃/라우팅 청크가 payload 대부분을 차지)
+    for m in _RSC_PUSH_RE.finditer(html):
+        if html.find(marker, m.start(1), m.end(1)) < 0:
+            continue
+
+        # 필요한 청크만 UTF-8 디코딩
+        yield decode_rsc_chunk(m.group(1).decode("utf-8"))
 
 
 # ─── 유닛 매핑 수집 ───
@@ -178,76 +258,51 @@ def fetch_unit_mapping() -> dict:
     Returns:
         {unitId(int): {"ko": "한글명", "en": "영문명"}, ...}
     """
-    print("🏠 홈페이지에서 유닛 매핑 수집 중...")
-
-    req = Request("https://blip.kr", headers=DEFAULT_HEADERS)
+    log.info("🏠 홈페이지에서 유닛 매핑 수집 중...")
 
     try:
-        with urlopen(req, timeout=20) as response:
-            html = response.read().decode("utf-8")
-    except (URLError, HTTPError) as e:
-        print(f"  ⚠️  홈페이지 요청 실패: {e}")
+        html = fetch_html("/")
+    except (http.client.HTTPException, OSError) as e:
+        log.warning(f"  ⚠️  홈페이지 요청 실패: {e}")
         return {}
 
-    rsc_chunks = re.findall(
-        r'self\.__next_f\.push\(\[1,"(.*?)"\]\)', html, re.DOTALL
-    )
-
-    for chunk in rsc_chunks:
-        if "blipName" not in chunk:
-            continue
-
-        raw = decode_rsc_chunk(chunk)
-
-        # unitId, blipName(한글명) 추출
-        ko_matches = re.findall(
-            r'\{"unitId":(\d+),"artistId":\d+,"isFilter":\d+,"blipName":"([^"]*)"',
-            raw,
-        )
-
-        # 영문명 추출
-        en_matches = re.findall(
-            r'\{"code":"en","name":"([^"]*)","unitId":(\d+)\}',
-            raw,
-        )
+    for raw in _rsc_chunks(html, b"blipName"):
+        # unitId → blipName(한글명), unitId → 영문명 추출
+        ko_map = {}
         en_map = {}
-        for en_name, uid_str in en_matches:
-            en_map[int(uid_str)] = en_name
+        for unit in _UNIT_RE.finditer(raw):
+            if unit["ko_uid"] is not None:
+                ko_map[int(unit["ko_uid"])] = unit["ko"]
+            else:
+                en_map[int(unit["en_uid"])] = unit["en"]
 
         # 매핑 구성
         unit_map = {}
-        for uid_str, ko_name in ko_matches:
-            uid = int(uid_str)
+        for uid, ko_name in ko_map.items():
             unit_map[uid] = {
                 "ko": ko_name,
                 "en": en_map.get(uid, ko_name),
             }
 
-        print(f"  ✅ {len(unit_map)}개 그룹 매핑 확보")
+        log.info(f"  ✅ {len(unit_map)}개 그룹 매핑 확보")
         return unit_map
 
-    print("  ⚠️  홈페이지에서 유닛 데이터를 찾을 수 없음")
+    log.warning("  ⚠️  홈페이지에서 유닛 데이터를 찾을 수 없음")
     return {}
 
 
 # ─── RSC Payload 이벤트 파싱 ───
 
-def extract_rsc_events(html: str) -> list[dict]:
+def extract_rsc_events(html: bytes) -> Iterator[dict[str, Any]]:
     """
     Next.js RSC payload에서 스케줄 이벤트 추출.
     self.__next_f.push([1, "..."]) 내의 scheduleId 객체들을 파싱.
-    """
-    rsc_chunks = re.findall(
-        r'self\.__next_f\.push\(\[1,"(.*?)"\]\)', html, re.DOTALL
-    )
-
-    for chunk in rsc_chunks:
-        if "scheduleId" not in chunk:
-            continue
 
-        raw = decode_rsc_chunk(chunk)
-
-        events = []
+    이벤트 리스트를 만들지 않고 파싱되는 대로 하나씩 yield하는 제너레이터.
+    이벤트가 들어 있는 첫 청크만 사용.
+    """
+    for raw in _rsc_chunks(html, b"scheduleId"):
+        found = False
         pos = 0
 
         while True:
@@ -255,62 +310,145 @@ def extract_rsc_events(html: str) -> list[dict]:
             if obj_start < 0:
                 break
 
-            # 매칭되는 중괄호 끝 찾기
-            depth = 0
-            obj_end = obj_start
-            for j in range(obj_start, min(obj_start + 10000, len(raw))):
-                if raw[j] == "{":
-                    depth += 1
-                elif raw[j] == "}":
-                    depth -= 1
-                if depth == 0:
-                    obj_end = j + 1
-                    break
+            # raw_decode는 문자열 내부의 중괄호·이스케이프까지 처리하므로
+            # 중괄호 카운팅이나 message 필드 정리 없이 객체 끝을 찾음
+            try:
+                obj, obj_end = _JSON_DECODER.raw_decode(raw, obj_start)
+            except json.JSONDecodeError:
+                pos = obj_start + 1
+                continue
 
-            obj_str = raw[obj_start:obj_end]
+            found = True
+            yield obj
+            pos = obj_end
 
-            # message 필드 내 줄바꿈 등으로 JSON 파싱 실패 방지
-            obj_str = re.sub(r'"message":"[^"]*"', '"message":""', obj_str)
+        if found:
+            return
 
-            try:
-                obj = json.loads(obj_str)
-                events.append(obj)
-            except json.JSONDecodeError:
-                pass
 
-            pos = obj_end + 1
+# ─── 키워드 매칭 ───
 
-        if events:
-            return events
+# 키워드 → dict별 (우선순위, 라벨) 또는 None
+_KeywordHits = tuple[tuple[int, str] | None, ...]
+# (정규식, 키워드별 히트, dict 개수)
+_KeywordMatcher = tuple[re.Pattern[str], dict[str, _KeywordHits], int]
 
-    return []
 
+def _build_keyword_matcher(*keyword_dicts: dict[str, list[str]]) -> _KeywordMatcher:
+    """
+    여러 {라벨: [키워드]} dict의 키워드를 정규식 하나로 묶은 매처 생성.
+
+    반환: (정규식, 키워드 → dict별 (우선순위, 라벨) 튜플 (해당 없으면 None), dict 개수)
+    dict 선언 순서가 곧 우선순위 (앞쪽이 높음).
+    """
+    hits: dict[str, list[tuple[int, str] | None]] = {}
+    for i, keyword_groups in enumerate(keyword_dicts):
+        for rank, (label, keywords) in enumerate(keyword_groups.items()):
+            for kw in keywords:
+                per_dict = hits.setdefault(kw, [None] * len(keyword_dicts))
+                if per_dict[i] is None:
+                    per_dict[i] = (rank, label)
+
+    # 한 위치에서는 가장 긴 키워드가 매칭됨 (_trie_pattern 참고).
+    # 같은 위치에서 함께 매칭되는 키워드는 그 접두사뿐이므로 결과를 미리 합쳐 둠
+    merged: dict[str, _KeywordHits] = {}
+    for kw, per_dict in hits.items():
+        combined = list(per_dict)
+        for other, other_hits in hits.items():
+            if other != kw and kw.startswith(other):
+                for i, hit in enumerate(other_hits):
+                    cur = combined[i]
+                    if hit is not None and (cur is None or hit < cur):
+                        combined[i] = hit
+        merged[kw] = tuple(combined)
+
+    pattern = re.compile(_trie_pattern(hits))
+    return pattern, merged, len(keyword_dicts)
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """
+    키워드를 공통 접두사끼리 묶은 정규식 문자열 생성.
+    예: Album, Album Release, Album Preview → Album(?: (?:Release|Preview))?
+
+    단순 alternation은 위치마다 키워드 수만큼 분기를 시도하지만, 트리 형태는
+    글자마다 분기 하나만 따라감. 키워드 끝의 ?는 탐욕적이므로 가장 긴 키워드가 먼저 매칭됨.
+    """
+    trie: dict = {}
+    for kw in keywords:
+        node = trie
+        for ch in kw:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # 키워드 끝 표시
+
+    def build(node: dict) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in node.items() if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
 
-def classify_event(event: dict) -> str:
-    """typeId + 제목 키워드로 카테고리 결정"""
-    type_id = event.get("typeId")
-    title = event.get("title", "")
+
+def _match_keywords(matcher: _KeywordMatcher, title: str) -> list[str | None]:
+    """제목을 한 번 훑어 dict별로 가장 우선순위가 높은 라벨 반환 (없으면 None)"""
+    pattern, hits, n_dicts = matcher
+    best: list[tuple[int, str] | None] = [None] * n_dicts
+    pos = 0
+
+    while True:
+        m = pattern.search(title, pos)
+        if m is None:
+            break
+        for i, hit in enumerate(hits[m.group()]):
+            cur = best[i]
+            if hit is not None and (cur is None or hit < cur):
+                best[i] = hit
+        # 겹치는 키워드도 놓치지 않도록 한 글자씩만 전진
+        pos = m.start() + 1
+
+    return [hit[1] if hit else None for hit in best]
+
+
+# 카테고리 + Paysable Tier 키워드를 한 번에 매칭
+# PAYSABLE_KEYWORDS 선언 순서 = Tier 우선순위 (포브_마감 → ... → 재입고_2차)
+_KEYWORD_MATCHER: Final = _build_keyword_matcher(CATEGORY_KEYWORDS, PAYSABLE_KEYWORDS)
+
+
+def classify_event_with_paysable(event: dict[str, Any]) -> tuple[str, str | None]:
+    """
+    제목을 한 번만 훑어 (카테고리, Paysable Tier)를 함께 결정.
+    Tier에 해당하지 않으면 Paysable 값은 None.
+    """
+    type_id: int | None = event.get("typeId")
+    title: str = event.get("title", "")
+
+    keyword_category, paysable = _match_keywords(_KEYWORD_MATCHER, title)
 
     # "N주년" 패턴은 축하로 분류 (발매보다 우선)
-    if re.search(r'\d+주년', title) or 'anniversary' in title.lower():
-        return "축하"
+    if _ANNIVERSARY_RE.search(title) or 'anniversary' in title.lower():
+        return "축하", paysable
 
     # 키워드 기반 세부 분류 (우선)
-    for category, keywords in CATEGORY_KEYWORDS.items():
-        for kw in keywords:
-            if kw in title:
-                return category
+    if keyword_category:
+        return keyword_category, paysable
 
     # typeId 기반 기본 분류 (fallback)
     # typeId=2(발매)는 발매 키워드 없으면 기타로 처리
-    # (MV Teaser, Concept Image 등은 기타로 분류)
-    if type_id == 2:
-        return "기타"
+    # (MV Teaser, Concept Image 등은 기타로 분류). typeId가 없는 이벤트도 기타
+    if type_id == 2 or type_id is None:
+        return "기타", paysable
 
-    return TYPE_ID_MAP.get(type_id, "기타")
+    return TYPE_ID_MAP.get(type_id, "기타"), paysable
 
 
-def classify_event_paysable(event: dict) -> str:
+def classify_event(event: dict[str, Any]) -> str:
+    """typeId + 제목 키워드로 카테고리 결정"""
+    return classify_event_with_paysable(event)[0]
+
+
+def classify_event_paysable(event: dict[str, Any]) -> str | None:
     """
     Paysable 마케팅 최적화: Tier 우선도 기반 발매/프리오더 이벤트 분류
 
@@ -318,71 +456,54 @@ def classify_event_paysable(event: dict) -> str:
     Tier 2: 발매일 > 첫 프레스 (재고 소진)
     Tier 3: 프리오더 오픈 > 팬사인/이벤트 > 재입고/2차 (보조)
     """
-    title = event.get("title", "")
-
-    # Tier 1: 마감 관련 (최고 우선순위)
-    # 1-1: POB 마감
-    for kw in PAYSABLE_KEYWORDS["포브_마감"]:
-        if kw in title:
-            return "포브_마감"
-
-    # 1-2: Lucky Draw 마감
-    for kw in PAYSABLE_KEYWORDS["럭키드로우_마감"]:
-        if kw in title:
-            return "럭키드로우_마감"
-
-    # 1-3: 프리오더 마감
-    for kw in PAYSABLE_KEYWORDS["프리오더_마감"]:
-        if kw in title:
-            return "프리오더_마감"
-
-    # Tier 2: 발매/첫 프레스
-    # 2-1: 발매일
-    for kw in PAYSABLE_KEYWORDS["발매일"]:
-        if kw in title:
-            return "발매일"
-
-    # 2-2: 첫 프레스
-    for kw in PAYSABLE_KEYWORDS["첫프레스"]:
-        if kw in title:
-            return "첫프레스"
-
-    # Tier 3: 오픈/이벤트/재입고
-    # 3-1: 프리오더 오픈
-    for kw in PAYSABLE_KEYWORDS["프리오더_오픈"]:
-        if kw in title:
-            return "프리오더_오픈"
-
-    # 3-2: 팬사인/이벤트
-    for kw in PAYSABLE_KEYWORDS["팬사인_이벤트"]:
-        if kw in title:
-            return "팬사인_이벤트"
-
-    # 3-3: 재입고/2차
-    for kw in PAYSABLE_KEYWORDS["재입고_2차"]:
-        if kw in title:
-            return "재입고_2차"
-
-    # Fallback: 분류 불가능 (해당 없음)
-    return None
-
-
-def parse_events_to_dict(events: list[dict], year: int, month: int) -> dict:
+    return classify_event_with_paysable(event)[1]
+
+
+KST: Final = timezone(timedelta(hours=9))
+
+
+@lru_cache(maxsize=4096)
+def _kst_date_key(utc_hour: str) -> str:
+    """
+    'YYYY-MM-DDTHH'(UTC) → KST 날짜 'YYYY-MM-DD'.
+
+    발매 일정은 같은 시각(KST 자정 = UTC 15시 등)에 몰려 있어 캐시 적중률이 높음.
+    UTC 15시 이후만 날짜가 하루 넘어가며, 월말/연말 이월도 정수 연산으로 처리.
+    """
+    if int(utc_hour[11:13]) < 15:
+        return utc_hour[:10]
+
+    y, mo, d = int(utc_hour[0:4]), int(utc_hour[5:7]), int(utc_hour[8:10]) + 1
+    if d > _last_day(y, mo):
+        d = 1
+        y, mo = (y + 1, 1) if mo == 12 else (y, mo + 1)
+    return f"{y:04d}-{mo:02d}-{d:02d}"
+
+
+def parse_events_to_dict(
+    events: Iterable[dict[str, Any]], year: int, month: int
+) -> dict[str, list[dict[str, Any]]]:
     """RSC 이벤트 리스트 → {날짜: [이벤트]} 딕셔너리 변환"""
-    result = {}
+    result: dict[str, list[dict[str, Any]]] = {}
+    seen_titles: dict[str, set[str]] = {}
     month_prefix = f"{year}-{month:02d}-"
 
     for event in events:
-        start_time = event.get("startTime", "")
+        start_time: str = event.get("startTime", "")
         if not start_time:
             continue
 
         # ISO 시간 → KST 날짜 변환
         # startTime: "2026-01-31T15:00:00.000Z" (UTC) → KST +9h → 2026-02-01
         try:
-            utc_dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-            kst_dt = utc_dt + timedelta(hours=9)
-            date_key = kst_dt.strftime("%Y-%m-%d")
+            if start_time.endswith("Z") and len(start_time) >= 20:
+                # 고정 형식은 'YYYY-MM-DDTHH'(UTC)만으로 KST 날짜가 정해짐
+                date_key = _kst_date_key(start_time[:13])
+            else:
+                utc_dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
+                if utc_dt.tzinfo is None:
+                    utc_dt = utc_dt.replace(tzinfo=timezone.utc)
+                date_key = utc_dt.astimezone(KST).strftime("%Y-%m-%d")
         except (ValueError, AttributeError):
             continue
 
@@ -390,55 +511,331 @@ def parse_events_to_dict(events: list[dict], year: int, month: int) -> dict:
         if not date_key.startswith(month_prefix):
             continue
 
-        title = event.get("title", "").strip()
+        title: str = event.get("title", "").strip()
         if not title:
             continue
 
-        category = classify_event(event)
-        unit_id = event.get("unitId")
+        # 중복 제거 (날짜별 제목 set을 유지하여 매 이벤트마다 다시 만들지 않음)
+        titles = seen_titles.setdefault(date_key, set())
+        if title in titles:
+            continue
+        titles.add(title)
 
-        if date_key not in result:
-            result[date_key] = []
+        category, paysable = classify_event_with_paysable(event)
+        unit_id = event.get("unitId")
 
-        # 중복 제거
-        existing_titles = {e["title"] for e in result[date_key]}
-        if title not in existing_titles:
-            entry = {
-                "title": title,
-                "category": category,
-            }
-            if unit_id is not None:
-                entry["unitId"] = unit_id
-            result[date_key].append(entry)
+        entry: dict[str, Any] = {
+            "title": title,
+            "category": category,
+        }
+        if paysable is not None:
+            entry["paysable"] = paysable
+        if unit_id is not None:
+            entry["unitId"] = unit_id
+        result.setdefault(date_key, []).append(entry)
 
-    return result
+    # 날짜 순 정렬 (한 달 31개 이하). 월 단위로 정렬해 두면 월을 순서대로 합치기만 해도
+    # 전체가 정렬된 상태가 됨
+    return dict(sorted(result.items()))
 
 
 # ─── HTTP 요청 ───
 
-def fetch_month(year: int, month: int) -> dict:
-    """특정 월의 스케줄 페이지에서 RSC payload 추출"""
-    url = f"https://blip.kr/schedule?year={year}&month={month}"
+BLIP_HOST = "blip.kr"
+
+# 전체 워커 합산 초당 요청 수 상한 (blip.kr 부하 고려)
+MAX_REQUESTS_PER_SEC = 1.0
 
-    req = Request(url, headers=DEFAULT_HEADERS)
+# urlopen처럼 리다이렉트를 따라감 (무한 루프 방지용 상한)
+MAX_REDIRECTS = 5
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+_thread_local = threading.local()
+_connections: list[http.client.HTTPSConnection] = []
+_connections_lock = threading.Lock()
+
+_rate_lock = threading.Lock()
+_next_request_at = 0.0
+
+
+def _wait_for_request_slot():
+    """
+    요청 시각을 1/MAX_REQUESTS_PER_SEC 간격으로 예약하고 차례가 올 때까지 대기.
+    워커 수와 무관하게 평균 요청 속도가 상한을 넘지 않음 (대기는 락 밖에서).
+    """
+    global _next_request_at
+    with _rate_lock:
+        now = time.monotonic()
+        slot = max(now, _next_request_at)
+        _next_request_at = slot + 1.0 / MAX_REQUESTS_PER_SEC
+    if slot > now:
+        time.sleep(slot - now)
+
+
+def _get_connection() -> http.client.HTTPSConnection:
+    """현재 스레드 전용 blip.kr 연결 (없으면 생성)"""
+    conn = getattr(_thread_local, "conn", None)
+    if conn is None:
+        conn = http.client.HTTPSConnection(BLIP_HOST, timeout=20)
+        _thread_local.conn = conn
+        with _connections_lock:
+            _connections.append(conn)
+    return conn
+
+
+def close_connections():
+    """모든 스레드가 열어 둔 blip.kr 연결 종료"""
+    with _connections_lock:
+        for conn in _connections:
+            conn.close()
+        _connections.clear()
+
+
+def _request_blip(
+    target: str, headers: dict[str, str]
+) -> tuple[http.client.HTTPResponse, bytes]:
+    """
+    스레드별 keep-alive 연결로 blip.kr에 GET 요청. 서버가 유휴 연결을
+    끊은 경우 새 연결로 1회 재시도. 반환: (응답, 본문 bytes)
+    """
+    for _ in range(2):
+        # 재시도도 실제 요청이므로 매 시도마다 속도 제한 슬롯을 받음
+        _wait_for_request_slot()
+        conn = _get_connection()
+        try:
+            conn.request("GET", target, headers=headers)
+            response = conn.getresponse()
+            return response, response.read()
+        except (http.client.HTTPException, OSError) as e:
+            conn.close()
+            _thread_local.conn = None
+            error = e
+    raise error
+
+
+def _request_other_host(
+    url: str, target: str, headers: dict[str, str]
+) -> tuple[http.client.HTTPResponse, bytes]:
+    """리다이렉트로 다른 호스트에 가는 경우: 일회용 연결로 GET 요청"""
+    parts = urlsplit(url)
+    conn: http.client.HTTPConnection
+    if parts.scheme == "https":
+        conn = http.client.HTTPSConnection(parts.netloc, timeout=20)
+    else:
+        conn = http.client.HTTPConnection(parts.netloc, timeout=20)
+
+    _wait_for_request_slot()
+    try:
+        conn.request("GET", target, headers=headers)
+        response = conn.getresponse()
+        return response, response.read()
+    finally:
+        conn.close()
+
+
+def http_request(
+    path: str, extra_headers: dict[str, str] | None = None
+) -> tuple[int, http.client.HTTPMessage, bytes | None]:
+    """
+    blip.kr GET 요청. 스레드별 keep-alive 연결을 재사용하여
+    TCP/TLS 핸드셰이크를 워커당 1회로 줄임.
+
+    반환: (상태 코드, 응답 헤더, 본문 bytes). 304(조건부 요청 시에만 허용)면 본문은 None.
+    본문은 디코딩하지 않음 (필요한 RSC 청크만 나중에 디코딩).
+    3xx는 urlopen처럼 Location을 따라가고(최대 MAX_REDIRECTS회, 같은 호스트면
+    기존 연결 재사용), 그 외 200이 아닌 응답은 HTTPError로 올림.
+    """
+    headers = {**DEFAULT_HEADERS, **extra_headers} if extra_headers else DEFAULT_HEADERS
+
+    url = f"https://{BLIP_HOST}{path}"
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+        if parts.scheme == "https" and parts.netloc == BLIP_HOST:
+            response, body = _request_blip(target, headers)
+        else:
+            response, body = _request_other_host(url, target, headers)
+
+        location = response.getheader("Location")
+        if response.status not in _REDIRECT_STATUSES or not location:
+            break
+        next_url = urljoin(url, location)
+        if urlsplit(next_url).scheme not in ("http", "https"):
+            raise HTTPError(next_url, response.status, "unsupported redirect scheme",
+                            response.headers, None)
+        url = next_url
+    else:
+        raise HTTPError(url, response.status, "too many redirects", response.headers, None)
+
+    if response.status == 304 and extra_headers:
+        return 304, response.headers, None
+
+    if response.status != 200:
+        raise HTTPError(url, response.status, response.reason, response.headers, None)
+
+    if response.getheader("Content-Encoding", "").lower() == "gzip":
+        try:
+            body = gzip.decompress(body)
+        except (EOFError, zlib.error) as e:
+            # 잘리거나 손상된 본문은 파싱 오류가 아니라 요청 실패로 처리
+            # (BadGzipFile은 OSError라 호출부에서 이미 잡힘)
+            raise http.client.HTTPException(f"손상된 gzip 응답: {url}: {e}") from e
+
+    return 200, response.headers, body
+
+
+# ─── 디스크 캐시 (조건부 요청으로 재검증, 같은 HTML은 재파싱 생략) ───
+
+CACHE_DIR = Path(".cache")
+
+# 스크립트가 바뀌면(키워드·분류 규칙 수정 등) 파싱 캐시를 무효화하기 위한 지문
+_SCRIPT_DIGEST = hashlib.md5(Path(__file__).read_bytes()).hexdigest()
+
+
+def _write_cache(cache_file: Path, data: bytes):
+    """임시 파일에 쓴 뒤 교체 (중간에 중단돼도 잘린 캐시가 남지 않음). 실패는 무시."""
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        tmp = cache_file.with_suffix(".tmp")
+        tmp.write_bytes(data)
+        tmp.replace(cache_file)
+    except OSError:
+        pass
+
+
+def _html_cache_files(path: str) -> tuple[Path, Path]:
+    """(본문 파일, 검증자(ETag/Last-Modified) 파일)"""
+    key = hashlib.md5(path.encode()).hexdigest()
+    return CACHE_DIR / f"{key}.html", CACHE_DIR / f"{key}.validators.json"
+
+
+def _parsed_cache_file(year: int, month: int, html: bytes) -> Path:
+    """키: (연, 월, 스크립트 해시, HTML 해시)"""
+    digest = hashlib.md5(f"{year}-{month}|{_SCRIPT_DIGEST}|".encode())
+    digest.update(html)
+    return CACHE_DIR / f"{digest.hexdigest()}.json"
+
+
+def read_html_cache(path: str) -> tuple[bytes | None, dict[str, str | None]]:
+    """캐시된 (본문, 검증자 dict) 반환. 없으면 (None, {})"""
+    body_file, validators_file = _html_cache_files(path)
+    try:
+        validators = json.loads(validators_file.read_text(encoding="utf-8"))
+        return body_file.read_bytes(), validators
+    except (OSError, json.JSONDecodeError):
+        return None, {}
+
+
+def write_html_cache(path: str, html: bytes, validators: dict[str, str | None]):
+    body_file, validators_file = _html_cache_files(path)
+    _write_cache(body_file, html)
+    _write_cache(validators_file, json.dumps(validators).encode("utf-8"))
+
+
+def fetch_html(path: str, refresh: bool = False) -> bytes:
+    """
+    캐시를 거쳐 페이지 HTML(UTF-8 bytes) 반환.
+
+    캐시된 ETag/Last-Modified로 조건부 요청하고, 304면 캐시 본문을 재사용.
+    refresh=True(현재·다음 달처럼 자주 바뀌는 페이지)면 조건 없이 새로 받음.
+    검증자를 주지 않는 응답은 재검증할 수 없으므로 캐시하지 않음.
+    """
+    cached_html, validators = read_html_cache(path) if not refresh else (None, {})
+
+    conditional: dict[str, str] = {}
+    if cached_html is not None:
+        if etag := validators.get("etag"):
+            conditional["If-None-Match"] = etag
+        if last_modified := validators.get("last_modified"):
+            conditional["If-Modified-Since"] = last_modified
+
+    _, headers, html = http_request(path, conditional)
+
+    if html is None:
+        # 304는 조건부 요청(캐시 본문이 있을 때)에만 허용되므로 cached_html이 있음
+        assert cached_html is not None
+        # prune_cache가 아직 유효한 캐시를 지우지 않도록 수정 시각 갱신
+        for cache_file in _html_cache_files(path):
+            try:
+                cache_file.touch()
+            except OSError:
+                pass
+        return cached_html
+
+    validators = {
+        "etag": headers.get("ETag"),
+        "last_modified": headers.get("Last-Modified"),
+    }
+    if validators["etag"] or validators["last_modified"]:
+        write_html_cache(path, html, validators)
+
+    return html
+
+
+def read_parsed_cache(year: int, month: int, html: bytes):
+    """같은 HTML을 이미 파싱한 결과가 있으면 반환 (없으면 None)"""
+    try:
+        data = _parsed_cache_file(year, month, html).read_bytes()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def write_parsed_cache(year: int, month: int, html: bytes, month_events: dict):
+    """파싱 결과 저장. 캐시는 최적화일 뿐이므로 직렬화 실패도 무시 (파싱 결과는 유지)."""
+    try:
+        data = _dumps_compact(month_events)
+    except (TypeError, ValueError):
+        # 짝 없는 서로게이트가 든 제목 등 UTF-8로 쓸 수 없는 값 → 캐시만 건너뜀
+        return
+    _write_cache(_parsed_cache_file(year, month, html), data)
+
+
+def prune_cache(max_age_days: int = 7):
+    """오래 쓰이지 않은 캐시 파일 정리 (지난 HTML·파싱 결과가 계속 쌓이지 않도록)"""
+    cutoff = time.time() - max_age_days * 86400
+    for cache_file in CACHE_DIR.glob("*"):
+        try:
+            if cache_file.stat().st_mtime < cutoff:
+                cache_file.unlink()
+        except OSError:
+            pass
+
+
+def fetch_month(year: int, month: int, refresh: bool = False) -> dict:
+    """
+    특정 월의 스케줄 페이지에서 RSC payload 추출.
+    refresh=True면 캐시 재검증 없이 항상 새로 받음.
+    """
+    path = f"/schedule?year={year}&month={month}"
+
+    log.info(f"  🔄 {year}-{month:02d} 수집 중...")
 
     try:
-        with urlopen(req, timeout=20) as response:
-            html = response.read().decode("utf-8")
+        html = fetch_html(path, refresh)
+
+        month_events = read_parsed_cache(year, month, html)
+        if month_events is not None:
+            return month_events
 
         events = extract_rsc_events(html)
 
-        if not events:
-            print(f"  ⚠️  {year}-{month:02d}: RSC payload에 이벤트 없음")
+        # 제너레이터이므로 첫 이벤트를 꺼내 보고 비어 있는지 확인
+        first = next(events, None)
+        if first is None:
+            log.warning(f"  ⚠️  {year}-{month:02d}: RSC payload에 이벤트 없음")
             return {}
 
-        return parse_events_to_dict(events, year, month)
+        month_events = parse_events_to_dict(chain([first], events), year, month)
+        write_parsed_cache(year, month, html, month_events)
+        return month_events
 
-    except (URLError, HTTPError) as e:
-        print(f"  ⚠️  {year}-{month:02d} 요청 실패: {e}")
+    except (http.client.HTTPException, OSError) as e:
+        log.warning(f"  ⚠️  {year}-{month:02d} 요청 실패: {e}")
         return {}
     except Exception as e:
-        print(f"  ⚠️  {year}-{month:02d} 파싱 오류: {e}")
+        log.warning(f"  ⚠️  {year}-{month:02d} 파싱 오류: {e}")
         return {}
 
 
@@ -448,9 +845,10 @@ def scrape_schedule() -> dict:
     """전월 1일 ~ 실행일 기준 1년 후까지 스케줄 수집"""
     today = datetime.now()
 
+    prune_cache()
+
     # 유닛 매핑 먼저 수집
     unit_map = fetch_unit_mapping()
-    time.sleep(random.uniform(1.0, 2.0))
 
     # 시작: 전월 1일
     if today.month == 1:
@@ -462,27 +860,12 @@ def scrape_schedule() -> dict:
     end_date = today + timedelta(days=365)
     end_year, end_month = end_date.year, end_date.month
 
-    print(f"📅 스크래핑 범위: {start_year}-{start_month:02d} ~ {end_year}-{end_month:02d}")
-
-    all_events = {}
-    total_months = 0
+    log.info(f"📅 스크래핑 범위: {start_year}-{start_month:02d} ~ {end_year}-{end_month:02d}")
 
+    months = []
     year, month = start_year, start_month
     while (year, month) <= (end_year, end_month):
-        print(f"  🔄 {year}-{month:02d} 수집 중...")
-
-        month_events = fetch_month(year, month)
-
-        for date_key, event_list in month_events.items():
-            if date_key not in all_events:
-                all_events[date_key] = []
-            existing_titles = {e["title"] for e in all_events[date_key]}
-            for event in event_list:
-                if event["title"] not in existing_titles:
-                    all_events[date_key].append(event)
-                    existing_titles.add(event["title"])
-
-        total_months += 1
+        months.append((year, month))
 
         # 다음 월
         if month == 12:
@@ -490,11 +873,28 @@ def scrape_schedule() -> dict:
         else:
             month += 1
 
-        # 요청 간 간격 (1-2초)
-        time.sleep(random.uniform(1.0, 2.0))
+    # 현재·다음 달은 변동이 잦으므로 캐시 재검증 없이 항상 새로 받음
+    if today.month == 12:
+        next_month = (today.year + 1, 1)
+    else:
+        next_month = (today.year, today.month + 1)
+    live_months = {(today.year, today.month), next_month}
+
+    # 월별 요청은 서로 독립적이므로 병렬 수집 (결과는 months 순서 유지)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(executor.map(
+            lambda ym: fetch_month(ym[0], ym[1], refresh=ym in live_months), months
+        ))
 
-    # 날짜 순 정렬
-    sorted_events = dict(sorted(all_events.items()))
+    # 병합은 메인 스레드에서만 수행 (락 불필요)
+    # parse_events_to_dict가 해당 월 날짜만 남기고 날짜별 중복도 제거하므로
+    # 월별 결과의 날짜 키는 서로 겹치지 않음 → 재중복검사 없이 합치기만 하면 됨.
+    # results는 months(시간 순) 순서이고 각 월은 날짜 순이므로 합친 결과도 날짜 순
+    sorted_events = {}
+    for month_events in results:
+        sorted_events.update(month_events)
+
+    total_months = len(months)
 
     total_events = sum(len(v) for v in sorted_events.values())
     total_days = len(sorted_events)
@@ -517,11 +917,11 @@ def scrape_schedule() -> dict:
             unmapped += 1
             units[str(uid)] = {"ko": "기타 그룹", "en": "Other"}
 
-    print(f"\n✅ 스크래핑 완료!")
-    print(f"   - 수집 월수: {total_months}개월")
-    print(f"   - 일정 있는 날: {total_days}일")
-    print(f"   - 총 이벤트: {total_events}개")
-    print(f"   - 그룹 수: {len(units)}개 (매핑: {len(units)-unmapped}, 기타: {unmapped})")
+    log.info("\n✅ 스크래핑 완료!")
+    log.info(f"   - 수집 월수: {total_months}개월")
+    log.info(f"   - 일정 있는 날: {total_days}일")
+    log.info(f"   - 총 이벤트: {total_events}개")
+    log.info(f"   - 그룹 수: {len(units)}개 (매핑: {len(units)-unmapped}, 기타: {unmapped})")
 
     result = {
         "updated_at": today.isoformat(),
@@ -545,38 +945,72 @@ def scrape_schedule() -> dict:
 
 
 def _last_day(year: int, month: int) -> int:
-    if month == 12:
-        return 31
-    return (datetime(year, month + 1, 1) - timedelta(days=1)).day
+    return calendar.monthrange(year, month)[1]
 
 
 # ─── 저장 ───
 
+def _dumps_compact(obj) -> bytes:
+    """
+    공백 없는 UTF-8 JSON (orjson이 있으면 사용).
+    짝 없는 서로게이트는 U+FFFD로 바꿔 저장 (orjson 유무와 관계없이 같은 결과).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # 서로게이트 등 orjson이 거부하는 값 → 표준 json으로 처리
+            pass
+    text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    try:
+        return text.encode("utf-8")
+    except UnicodeEncodeError:
+        return _LONE_SURROGATE_RE.sub("\ufffd", text).encode("utf-8")
+
+
 def save_json(data: dict, filename: str = "schedule.json"):
     # schedule.json에서 scheduleId 제외 (파일 크기 절약)
-    clean_data = json.loads(json.dumps(data))
-    for date_key in clean_data.get("events", {}):
-        for event in clean_data["events"][date_key]:
+    # 저장 후 data를 다시 쓰는 호출자가 없으므로 복사 없이 제자리에서 제거
+    for date_events in data.get("events", {}).values():
+        for event in date_events:
             event.pop("scheduleId", None)
 
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(clean_data, f, ensure_ascii=False, indent=2)
-    print(f"💾 {filename} 저장 완료")
+    # indent=2 대신 최상위 키와 날짜별 이벤트를 한 줄씩 기록:
+    # 파일 크기는 최소화 JSON에 가깝고, 커밋 diff는 날짜 단위로 읽힘
+    lines = []
+    for key, value in data.items():
+        if key == "events":
+            day_lines = [
+                _dumps_compact(date_key) + b":" + _dumps_compact(date_events)
+                for date_key, date_events in value.items()
+            ]
+            lines.append(b'"events":{\n' + b",\n".join(day_lines) + b"\n}")
+        else:
+            lines.append(_dumps_compact(key) + b":" + _dumps_compact(value))
+
+    with open(filename, "wb") as f:
+        f.write(b"{\n" + b",\n".join(lines) + b"\n}\n")
+    log.info(f"💾 {filename} 저장 완료")
 
 
 # ─── 메인 ───
 
 def main():
-    print("🎬 Blip.kr Schedule Scraper v4 (RSC + Unit Mapping) 시작\n")
+    # 진행 메시지는 기존 print와 같이 stdout으로 (로깅 잠금이 스레드 간 출력 직렬화)
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    log.info("🎬 Blip.kr Schedule Scraper v4 (RSC + Unit Mapping) 시작\n")
 
-    data = scrape_schedule()
+    try:
+        data = scrape_schedule()
+    finally:
+        close_connections()
 
     if data and data["stats"]["total_events"] > 0:
         save_json(data)
-        print(f"\n📊 저장: ./schedule.json")
-        print(f"📈 갱신: {data['updated_at']}")
+        log.info("\n📊 저장: ./schedule.json")
+        log.info(f"📈 갱신: {data['updated_at']}")
     else:
-        print("\n❌ 데이터 수집 실패 또는 이벤트 0건")
+        log.warning("\n❌ 데이터 수집 실패 또는 이벤트 0건")
         save_json(data or {"error": "no data", "updated_at": datetime.now().isoformat()})
 
 